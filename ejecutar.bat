@@ -11,10 +11,18 @@ if not exist "neuronet_core*.pyd" (
     if exist "C:\nb\neuronet_core*.pyd" (
         copy "C:\nb\neuronet_core*.pyd" .
     )
+    if exist "C:\nb\neuronet_gui*.pyd" (
+        copy "C:\nb\neuronet_gui*.pyd" .
+    )
 )
 
-:: Ejecutar la GUI
+:: Ejecutar la GUI: importarla como módulo para usar la extensión
+:: compilada si existe; si no, ejecutar el código fuente directamente
 echo Iniciando NeuroNet...
-python src\python\neuronet_gui.py
+if exist "neuronet_gui*.pyd" (
+    python -c "import neuronet_gui; neuronet_gui.main()"
+) else (
+    python src\python\neuronet_gui.py
+)
 
 pause
@@ -11,19 +11,31 @@ Uso:
 
 from setuptools import setup, Extension
 from Cython.Build import cythonize
+import numpy
 import os
+import shutil
 import sys
 import platform
 
 # Detectar sistema operativo
 is_windows = platform.system() == "Windows"
 
+# Usar ccache/sccache si está disponible: las recompilaciones tras editar
+# solo el wrapper se resuelven desde el cache en lugar de recompilar
+# GrafoDisperso.cpp desde cero
+if not is_windows:
+    _ccache = shutil.which("ccache") or shutil.which("sccache")
+    if _ccache:
+        os.environ.setdefault("CC", f"{_ccache} cc")
+        os.environ.setdefault("CXX", f"{_ccache} c++")
+
 # Directorio base del proyecto
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 
 # Directorios de código fuente
 CPP_DIR = os.path.join(BASE_DIR, "src", "cpp")
 CYTHON_DIR = os.path.join(BASE_DIR, "src", "cython")
+PYTHON_DIR = os.path.join(BASE_DIR, "src", "python")
 
 # Configurar directorio de build corto para evitar problemas con rutas largas en Windows
 if is_windows:
@@ -32,13 +44,17 @@ if is_windows:
         os.makedirs(BUILD_DIR)
     sys.argv.extend(['--build-lib', BUILD_DIR, '--build-temp', BUILD_DIR])
 
-# Argumentos de compilación según el sistema operativo
+# Argumentos de compilación según el sistema operativo.
+# La extensión se compila localmente (build_ext --inplace), por lo que
+# podemos optimizar para la CPU de la máquina (-march=native / /arch:AVX2).
 if is_windows:
-    extra_compile_args = ["/std:c++17", "/O2", "/EHsc"]
-    extra_link_args = []
+    extra_compile_args = ["/std:c++17", "/O2", "/arch:AVX2", "/EHsc", "/GL",
+                          "/openmp:experimental"]
+    extra_link_args = ["/LTCG"]
 else:
-    extra_compile_args = ["-std=c++17", "-O3", "-fPIC"]
-    extra_link_args = ["-std=c++17"]
+    extra_compile_args = ["-std=c++17", "-O3", "-march=native", "-ftree-vectorize",
+                          "-flto", "-fopenmp", "-fPIC"]
+    extra_link_args = ["-std=c++17", "-flto", "-fopenmp"]
 
 # Definir la extensión
 extensions = [
@@ -48,11 +64,22 @@ extensions = [
             os.path.join(CYTHON_DIR, "grafo_wrapper.pyx"),
             os.path.join(CPP_DIR, "GrafoDisperso.cpp"),
         ],
-        include_dirs=[CPP_DIR],
+        include_dirs=[CPP_DIR, numpy.get_include()],
+        define_macros=[("NPY_NO_DEPRECATED_API", "NPY_1_7_API_VERSION")],
         language="c++",
         extra_compile_args=extra_compile_args,
         extra_link_args=extra_link_args,
-    )
+    ),
+    # La GUI se compila en modo pure-python (sin renombrar a .pyx): elimina
+    # el despacho del intérprete en los manejadores de eventos. El .py se
+    # conserva como fallback si la extensión no está compilada.
+    Extension(
+        name="neuronet_gui",
+        sources=[os.path.join(PYTHON_DIR, "neuronet_gui.py")],
+        language="c++",
+        extra_compile_args=extra_compile_args,
+        extra_link_args=extra_link_args,
+    ),
 ]
 
 # Configuración del paquete
@@ -65,14 +92,17 @@ setup(
     ext_modules=cythonize(
         extensions,
         compiler_directives={
-            "language_level": "3",  # Python 3
-            "boundscheck": False,   # Desactivar comprobación de límites para rendimiento
-            "wraparound": False,    # Desactivar índices negativos para rendimiento
+            "language_level": "3",        # Python 3
+            "boundscheck": False,         # Desactivar comprobación de límites para rendimiento
+            "wraparound": False,          # Desactivar índices negativos para rendimiento
+            "initializedcheck": False,    # Sin verificación de memoryviews inicializados
+            "cdivision": True,            # División C nativa, sin chequeo de división por cero
         }
     ),
     python_requires=">=3.7",
     install_requires=[
         "cython>=0.29",
+        "numpy>=1.19",
         "networkx>=2.5",
         "matplotlib>=3.3",
     ],
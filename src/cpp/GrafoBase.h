@@ -99,9 +99,11 @@ public:
      * @brief Obtiene las aristas del subgrafo resultante de un BFS
      * @param nodoInicio Nodo de inicio para el BFS
      * @param profundidadMaxima Profundidad máxima de la búsqueda
+     * @param maxAristas Máximo de aristas a recolectar (-1 = sin límite)
      * @return Vector de pares (nodoOrigen, nodoDestino) representando las aristas
      */
-    virtual std::vector<std::pair<int, int>> getAristasSubgrafo(int nodoInicio, int profundidadMaxima) = 0;
+    virtual std::vector<std::pair<int, int>> getAristasSubgrafo(int nodoInicio, int profundidadMaxima,
+                                                                int maxAristas = -1) = 0;
 };
 
 #endif // GRAFO_BASE_H
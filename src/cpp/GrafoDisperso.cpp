@@ -6,6 +6,17 @@
 
 #include "GrafoDisperso.h"
 
+#include <charconv>
+#include <cstring>
+
+#if defined(__unix__) || defined(__APPLE__)
+#define NEURONET_USAR_MMAP 1
+#include <fcntl.h>
+#include <sys/mman.h>
+#include <sys/stat.h>
+#include <unistd.h>
+#endif
+
 GrafoDisperso::GrafoDisperso() : numNodos(0), numAristas(0) {
     std::cout << "[C++ Core] Inicializando GrafoDisperso..." << std::endl;
 }
@@ -54,41 +65,153 @@ void GrafoDisperso::construirCSR(std::vector<std::pair<int, int>>& aristas, int
     }
 }
 
-bool GrafoDisperso::cargarDatos(const std::string& filename) {
-    std::cout << "[C++ Core] Cargando dataset '" << filename << "'..." << std::endl;
-    
-    auto startTime = std::chrono::high_resolution_clock::now();
-    
+bool GrafoDisperso::cargarConMmap(const std::string& filename,
+                                  std::vector<std::pair<int, int>>& aristas,
+                                  int& maxNodo, bool& cancelado) {
+#ifdef NEURONET_USAR_MMAP
+    int fd = open(filename.c_str(), O_RDONLY);
+    if (fd < 0) {
+        return false;
+    }
+
+    struct stat st;
+    if (fstat(fd, &st) != 0 || st.st_size == 0) {
+        close(fd);
+        return st.st_size == 0; // Archivo vacío: carga válida sin aristas
+    }
+
+    size_t tam = (size_t)st.st_size;
+    const char* datos = (const char*)mmap(nullptr, tam, PROT_READ, MAP_PRIVATE, fd, 0);
+    if (datos == MAP_FAILED) {
+        close(fd);
+        return false;
+    }
+
+    // El archivo se recorre una sola vez de principio a fin
+    madvise((void*)datos, tam, MADV_SEQUENTIAL);
+
+    // Estimación de aristas para evitar realocaciones (~12 bytes por línea)
+    aristas.reserve(tam / 12);
+
+    const char* p = datos;
+    const char* fin = datos + tam;
+    size_t lineaNum = 0;
+
+    while (p < fin) {
+        lineaNum++;
+
+        // Consultar la señal de cancelación periódicamente
+        if ((lineaNum & 0xFFFF) == 0 && stopRequested) {
+            std::cout << "[C++ Core] Carga cancelada por el usuario en la linea "
+                      << lineaNum << "." << std::endl;
+            cancelado = true;
+            break;
+        }
+
+        const char* eol = (const char*)memchr(p, '\n', fin - p);
+        if (eol == nullptr) {
+            eol = fin;
+        }
+
+        // Ignorar líneas vacías o comentarios (comienzan con #)
+        while (p < eol && (*p == ' ' || *p == '\t')) p++;
+        if (p < eol && *p != '#') {
+            int origen, destino;
+
+            // std::from_chars parsea sobre el buffer mapeado sin copiar
+            // la línea a un string intermedio
+            auto r1 = std::from_chars(p, eol, origen);
+            if (r1.ec == std::errc()) {
+                const char* q = r1.ptr;
+                while (q < eol && (*q == ' ' || *q == '\t')) q++;
+
+                auto r2 = std::from_chars(q, eol, destino);
+                if (r2.ec == std::errc()) {
+                    aristas.emplace_back(origen, destino);
+                    maxNodo = std::max(maxNodo, std::max(origen, destino));
+                }
+            }
+        }
+
+        p = eol + 1;
+    }
+
+    munmap((void*)datos, tam);
+    close(fd);
+    return true;
+#else
+    (void)filename; (void)aristas; (void)maxNodo; (void)cancelado;
+    return false;
+#endif
+}
+
+bool GrafoDisperso::cargarConStream(const std::string& filename,
+                                    std::vector<std::pair<int, int>>& aristas,
+                                    int& maxNodo, bool& cancelado) {
     std::ifstream file(filename);
     if (!file.is_open()) {
-        std::cerr << "[C++ Core] Error: No se pudo abrir el archivo " << filename << std::endl;
         return false;
     }
-    
-    std::vector<std::pair<int, int>> aristas;
+
     std::string linea;
-    int maxNodo = 0;
     int lineaNum = 0;
-    
+
     while (std::getline(file, linea)) {
         lineaNum++;
-        
+
+        // Consultar la señal de cancelación periódicamente
+        if ((lineaNum & 0xFFFF) == 0 && stopRequested) {
+            std::cout << "[C++ Core] Carga cancelada por el usuario en la linea "
+                      << lineaNum << "." << std::endl;
+            cancelado = true;
+            break;
+        }
+
         // Ignorar líneas vacías o comentarios (comienzan con #)
         if (linea.empty() || linea[0] == '#') {
             continue;
         }
-        
+
         std::istringstream iss(linea);
         int origen, destino;
-        
+
         if (iss >> origen >> destino) {
             aristas.emplace_back(origen, destino);
             maxNodo = std::max(maxNodo, std::max(origen, destino));
         }
     }
-    
+
     file.close();
-    
+    return true;
+}
+
+bool GrafoDisperso::cargarDatos(const std::string& filename) {
+    std::cout << "[C++ Core] Cargando dataset '" << filename << "'..." << std::endl;
+
+    stopRequested = false;
+
+    auto startTime = std::chrono::high_resolution_clock::now();
+
+    std::vector<std::pair<int, int>> aristas;
+    int maxNodo = 0;
+    bool cancelado = false;
+
+    // Preferir el lector mmap (una pasada sobre el archivo mapeado, sin
+    // copias por línea); si no está disponible, leer con std::getline
+    bool leido = cargarConMmap(filename, aristas, maxNodo, cancelado);
+    if (!leido && !cancelado) {
+        leido = cargarConStream(filename, aristas, maxNodo, cancelado);
+    }
+
+    if (cancelado) {
+        return false;
+    }
+
+    if (!leido) {
+        std::cerr << "[C++ Core] Error: No se pudo abrir el archivo " << filename << std::endl;
+        return false;
+    }
+
     // Construir estructura CSR
     construirCSR(aristas, maxNodo);
     
@@ -111,41 +234,82 @@ std::vector<std::pair<int, int>> GrafoDisperso::BFS(int nodoInicio, int profundi
     auto startTime = std::chrono::high_resolution_clock::now();
     
     std::vector<std::pair<int, int>> resultado; // (nodo, distancia)
-    
+
     if (nodoInicio < 0 || nodoInicio >= numNodos) {
         std::cerr << "[C++ Core] Error: Nodo de inicio invalido." << std::endl;
         return resultado;
     }
-    
-    std::vector<bool> visitado(numNodos, false);
-    std::queue<std::pair<int, int>> cola; // (nodo, nivel)
-    
-    cola.push({nodoInicio, 0});
-    visitado[nodoInicio] = true;
-    
-    while (!cola.empty()) {
-        auto [nodoActual, nivel] = cola.front();
-        cola.pop();
-        
-        resultado.emplace_back(nodoActual, nivel);
-        
+
+    // BFS sincronizado por niveles: la expansión de cada frontera es
+    // paralelizable con OpenMP (el recorrido es memory-bound, por lo que
+    // unos pocos hilos bastan para saturar el ancho de banda)
+    std::vector<int> visitado(numNodos, 0);
+    std::vector<int> frontera;
+
+    frontera.push_back(nodoInicio);
+    visitado[nodoInicio] = 1;
+
+    int nivel = 0;
+    while (!frontera.empty()) {
+        for (int nodo : frontera) {
+            resultado.emplace_back(nodo, nivel);
+        }
+
         if (nivel >= profundidadMaxima) {
-            continue;
+            break;
         }
-        
-        // Obtener vecinos usando la estructura CSR
-        int inicio = row_ptr[nodoActual];
-        int fin = row_ptr[nodoActual + 1];
-        
-        for (int i = inicio; i < fin; i++) {
-            int vecino = column_indices[i];
-            if (!visitado[vecino]) {
-                visitado[vecino] = true;
-                cola.push({vecino, nivel + 1});
+
+        std::vector<int> siguiente;
+
+#ifdef _OPENMP
+        // Paralelizar solo fronteras grandes; en las pequeñas el costo de
+        // crear el equipo de hilos supera al del recorrido
+        #pragma omp parallel if(frontera.size() > 256)
+        {
+            std::vector<int> local;
+
+            #pragma omp for schedule(dynamic, 64) nowait
+            for (size_t f = 0; f < frontera.size(); f++) {
+                int nodoActual = frontera[f];
+                int inicio = row_ptr[nodoActual];
+                int fin = row_ptr[nodoActual + 1];
+
+                for (int i = inicio; i < fin; i++) {
+                    int vecino = column_indices[i];
+                    int previo;
+
+                    // Reclamar el nodo atómicamente: solo un hilo lo encola
+                    #pragma omp atomic capture
+                    { previo = visitado[vecino]; visitado[vecino] = 1; }
+
+                    if (!previo) {
+                        local.push_back(vecino);
+                    }
+                }
             }
+
+            #pragma omp critical
+            siguiente.insert(siguiente.end(), local.begin(), local.end());
         }
+#else
+        for (int nodoActual : frontera) {
+            int inicio = row_ptr[nodoActual];
+            int fin = row_ptr[nodoActual + 1];
+
+            for (int i = inicio; i < fin; i++) {
+                int vecino = column_indices[i];
+                if (!visitado[vecino]) {
+                    visitado[vecino] = 1;
+                    siguiente.push_back(vecino);
+                }
+            }
+        }
+#endif
+
+        frontera = std::move(siguiente);
+        nivel++;
     }
-    
+
     auto endTime = std::chrono::high_resolution_clock::now();
     auto duration = std::chrono::duration_cast<std::chrono::microseconds>(endTime - startTime);
     
@@ -274,7 +438,8 @@ size_t GrafoDisperso::getMemoriaUsada() {
     return memoria;
 }
 
-std::vector<std::pair<int, int>> GrafoDisperso::getAristasSubgrafo(int nodoInicio, int profundidadMaxima) {
+std::vector<std::pair<int, int>> GrafoDisperso::getAristasSubgrafo(int nodoInicio, int profundidadMaxima,
+                                                                   int maxAristas) {
     std::cout << "[C++ Core] Obteniendo aristas del subgrafo desde nodo " << nodoInicio << "..." << std::endl;
     
     std::vector<std::pair<int, int>> aristas;
@@ -303,15 +468,21 @@ std::vector<std::pair<int, int>> GrafoDisperso::getAristasSubgrafo(int nodoInici
         
         for (int i = inicio; i < fin; i++) {
             int vecino = column_indices[i];
-            
+
             // Agregar arista
             aristas.emplace_back(nodoActual, vecino);
-            
+
             if (nodosEnSubgrafo.find(vecino) == nodosEnSubgrafo.end()) {
                 nodosEnSubgrafo.insert(vecino);
                 cola.push({vecino, nivel + 1});
             }
         }
+
+        // Detener el recorrido al alcanzar el límite de aristas
+        if (maxAristas >= 0 && (int)aristas.size() >= maxAristas) {
+            aristas.resize(maxAristas);
+            break;
+        }
     }
     
     std::cout << "[C++ Core] Subgrafo obtenido. Nodos: " << nodosEnSubgrafo.size() 
@@ -320,6 +491,75 @@ std::vector<std::pair<int, int>> GrafoDisperso::getAristasSubgrafo(int nodoInici
     return aristas;
 }
 
+void GrafoDisperso::BFSConAristas(int nodoInicio, int profundidadMaxima,
+                                  std::vector<std::pair<int, int>>& niveles,
+                                  std::vector<std::pair<int, int>>& aristas,
+                                  int maxAristas) {
+    std::cout << "[C++ Core] Ejecutando BFS con aristas desde nodo " << nodoInicio
+              << " con profundidad maxima " << profundidadMaxima << "..." << std::endl;
+
+    auto startTime = std::chrono::high_resolution_clock::now();
+
+    niveles.clear();
+    aristas.clear();
+
+    if (nodoInicio < 0 || nodoInicio >= numNodos) {
+        std::cerr << "[C++ Core] Error: Nodo de inicio invalido." << std::endl;
+        return;
+    }
+
+    std::vector<bool> visitado(numNodos, false);
+    std::queue<std::pair<int, int>> cola; // (nodo, nivel)
+
+    cola.push({nodoInicio, 0});
+    visitado[nodoInicio] = true;
+
+    while (!cola.empty()) {
+        auto [nodoActual, nivel] = cola.front();
+        cola.pop();
+
+        niveles.emplace_back(nodoActual, nivel);
+
+        if (nivel >= profundidadMaxima) {
+            continue;
+        }
+
+        int inicio = row_ptr[nodoActual];
+        int fin = row_ptr[nodoActual + 1];
+
+        for (int i = inicio; i < fin; i++) {
+            int vecino = column_indices[i];
+
+            // Registrar la arista aunque el vecino ya haya sido visitado,
+            // igual que getAristasSubgrafo
+            aristas.emplace_back(nodoActual, vecino);
+
+            if (!visitado[vecino]) {
+                visitado[vecino] = true;
+                cola.push({vecino, nivel + 1});
+            }
+        }
+
+        // Al alcanzar el límite de aristas, dejar de expandir pero vaciar
+        // la cola para conservar los niveles de los nodos ya descubiertos
+        if (maxAristas >= 0 && (int)aristas.size() >= maxAristas) {
+            aristas.resize(maxAristas);
+            while (!cola.empty()) {
+                niveles.push_back(cola.front());
+                cola.pop();
+            }
+            break;
+        }
+    }
+
+    auto endTime = std::chrono::high_resolution_clock::now();
+    auto duration = std::chrono::duration_cast<std::chrono::microseconds>(endTime - startTime);
+
+    std::cout << "[C++ Core] BFS con aristas completado. Nodos: " << niveles.size()
+              << " | Aristas: " << aristas.size()
+              << ". Tiempo ejecucion: " << duration.count() / 1000.0 << " ms." << std::endl;
+}
+
 void GrafoDisperso::printDebugInfo() {
     std::cout << "\n=== Debug Info ===" << std::endl;
     std::cout << "Nodos: " << numNodos << std::endl;
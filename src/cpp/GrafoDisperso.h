@@ -11,6 +11,7 @@
 #define GRAFO_DISPERSO_H
 
 #include "GrafoBase.h"
+#include <atomic>
 #include <iostream>
 #include <fstream>
 #include <sstream>
@@ -45,6 +46,8 @@ private:
     
     // Para grado de entrada (requiere estructura adicional o cálculo)
     std::vector<int> gradoEntrada;   ///< Cache del grado de entrada por nodo
+
+    std::atomic<bool> stopRequested{false}; ///< Señal de cancelación de la carga en curso
     
     /**
      * @brief Construye la estructura CSR a partir de una lista de aristas
@@ -53,6 +56,28 @@ private:
      */
     void construirCSR(std::vector<std::pair<int, int>>& aristas, int maxNodo);
 
+    /**
+     * @brief Lee el archivo completo mapeado en memoria (mmap, solo POSIX)
+     * @param filename Ruta al archivo en formato Edge List
+     * @param aristas [salida] Aristas leídas
+     * @param maxNodo [salida] ID máximo de nodo encontrado
+     * @param cancelado [salida] true si la carga fue cancelada
+     * @return true si el archivo pudo mapearse y leerse
+     */
+    bool cargarConMmap(const std::string& filename, std::vector<std::pair<int, int>>& aristas,
+                       int& maxNodo, bool& cancelado);
+
+    /**
+     * @brief Lee el archivo línea por línea con std::getline (portable)
+     * @param filename Ruta al archivo en formato Edge List
+     * @param aristas [salida] Aristas leídas
+     * @param maxNodo [salida] ID máximo de nodo encontrado
+     * @param cancelado [salida] true si la carga fue cancelada
+     * @return true si el archivo pudo abrirse y leerse
+     */
+    bool cargarConStream(const std::string& filename, std::vector<std::pair<int, int>>& aristas,
+                         int& maxNodo, bool& cancelado);
+
 public:
     /**
      * @brief Constructor por defecto
@@ -75,8 +100,47 @@ public:
     int getNumAristas() override;
     std::pair<int, int> getNodoMayorGrado() override;
     size_t getMemoriaUsada() override;
-    std::vector<std::pair<int, int>> getAristasSubgrafo(int nodoInicio, int profundidadMaxima) override;
+    std::vector<std::pair<int, int>> getAristasSubgrafo(int nodoInicio, int profundidadMaxima,
+                                                        int maxAristas = -1) override;
     
+    /**
+     * @brief Ejecuta un BFS y recolecta las aristas del subgrafo en una sola pasada
+     *
+     * Combina BFS() y getAristasSubgrafo() en un único recorrido sobre la
+     * estructura CSR, evitando repetir el recorrido (el costo dominante en
+     * grafos grandes es el acceso a memoria, no el cálculo).
+     *
+     * @param nodoInicio Nodo de inicio para el BFS
+     * @param profundidadMaxima Profundidad máxima de la búsqueda
+     * @param niveles [salida] Vector de pares (nodo, distancia) visitados
+     * @param aristas [salida] Vector de pares (origen, destino) del subgrafo
+     * @param maxAristas Máximo de aristas a recolectar (-1 = sin límite)
+     */
+    void BFSConAristas(int nodoInicio, int profundidadMaxima,
+                       std::vector<std::pair<int, int>>& niveles,
+                       std::vector<std::pair<int, int>>& aristas,
+                       int maxAristas = -1);
+
+    /**
+     * @brief Solicita cancelar la carga en curso (cooperativo)
+     *
+     * Seguro de llamar desde otro hilo: cargarDatos consulta la señal
+     * periódicamente y aborta retornando false.
+     */
+    void solicitarDetencion() { stopRequested = true; }
+
+    /**
+     * @brief Acceso de solo lectura al vector row_ptr del CSR
+     * @return Puntero al primer elemento (numNodos + 1 enteros)
+     */
+    const int* getRowPtrData() const { return row_ptr.data(); }
+
+    /**
+     * @brief Acceso de solo lectura al vector column_indices del CSR
+     * @return Puntero al primer elemento (numAristas enteros)
+     */
+    const int* getColumnIndicesData() const { return column_indices.data(); }
+
     /**
      * @brief Imprime información de debug del grafo
      */
@@ -9,15 +9,23 @@ from libcpp.pair cimport pair
 cdef extern from "GrafoDisperso.h":
     cdef cppclass GrafoDisperso:
         GrafoDisperso() except +
-        bint cargarDatos(string filename)
-        vector[pair[int, int]] BFS(int nodoInicio, int profundidadMaxima)
-        vector[int] DFS(int nodoInicio)
+        bint cargarDatos(string filename) nogil
+        vector[pair[int, int]] BFS(int nodoInicio, int profundidadMaxima) nogil
+        vector[int] DFS(int nodoInicio) nogil
         int obtenerGrado(int nodo)
         int obtenerGradoEntrada(int nodo)
         vector[int] getVecinos(int nodo)
         int getNumNodos()
         int getNumAristas()
-        pair[int, int] getNodoMayorGrado()
+        pair[int, int] getNodoMayorGrado() nogil
         size_t getMemoriaUsada()
-        vector[pair[int, int]] getAristasSubgrafo(int nodoInicio, int profundidadMaxima)
+        vector[pair[int, int]] getAristasSubgrafo(int nodoInicio, int profundidadMaxima,
+                                                  int maxAristas) nogil
+        void BFSConAristas(int nodoInicio, int profundidadMaxima,
+                           vector[pair[int, int]]& niveles,
+                           vector[pair[int, int]]& aristas,
+                           int maxAristas) nogil
+        void solicitarDetencion()
+        const int* getRowPtrData()
+        const int* getColumnIndicesData()
         void printDebugInfo()
@@ -13,26 +13,62 @@ from libcpp.vector cimport vector
 from libcpp.pair cimport pair
 from cython.operator cimport dereference as deref
 
+from cpython.ref cimport Py_INCREF
+
 import time
 
+import numpy as np
+cimport numpy as cnp
+
+cnp.import_array()
+
 # Importar la declaración de la clase C++
 cdef extern from "GrafoDisperso.h":
     cdef cppclass GrafoDisperso:
         GrafoDisperso() except +
-        bint cargarDatos(string filename)
-        vector[pair[int, int]] BFS(int nodoInicio, int profundidadMaxima)
-        vector[int] DFS(int nodoInicio)
+        # Los métodos pesados se declaran nogil: no tocan objetos Python,
+        # así que el GIL puede liberarse mientras C++ trabaja
+        bint cargarDatos(string filename) nogil
+        vector[pair[int, int]] BFS(int nodoInicio, int profundidadMaxima) nogil
+        vector[int] DFS(int nodoInicio) nogil
         int obtenerGrado(int nodo)
         int obtenerGradoEntrada(int nodo)
         vector[int] getVecinos(int nodo)
         int getNumNodos()
         int getNumAristas()
-        pair[int, int] getNodoMayorGrado()
+        pair[int, int] getNodoMayorGrado() nogil
         size_t getMemoriaUsada()
-        vector[pair[int, int]] getAristasSubgrafo(int nodoInicio, int profundidadMaxima)
+        vector[pair[int, int]] getAristasSubgrafo(int nodoInicio, int profundidadMaxima,
+                                                  int maxAristas) nogil
+        void BFSConAristas(int nodoInicio, int profundidadMaxima,
+                           vector[pair[int, int]]& niveles,
+                           vector[pair[int, int]]& aristas,
+                           int maxAristas) nogil
+        void solicitarDetencion()
+        const int* getRowPtrData()
+        const int* getColumnIndicesData()
         void printDebugInfo()
 
 
+cdef _aristas_a_ndarray(vector[pair[int, int]]& aristas):
+    """
+    Convierte un vector C++ de aristas a un arreglo NumPy de forma (E, 2).
+
+    Una sola reserva contigua de int64 en lugar de E tuplas y 2E enteros
+    Python; el llenado se hace sin el GIL.
+    """
+    cdef Py_ssize_t n = aristas.size()
+    cdef long long[:, ::1] out = np.empty((n, 2), dtype=np.int64)
+    cdef Py_ssize_t i
+
+    with nogil:
+        for i in range(n):
+            out[i, 0] = aristas[i].first
+            out[i, 1] = aristas[i].second
+
+    return np.asarray(out)
+
+
 cdef class PyGrafoDisperso:
     """
     Wrapper Python para la clase C++ GrafoDisperso.
@@ -78,7 +114,8 @@ cdef class PyGrafoDisperso:
         cdef bint resultado
         
         inicio = time.time()
-        resultado = self._grafo.cargarDatos(cpp_filename)
+        with nogil:
+            resultado = self._grafo.cargarDatos(cpp_filename)
         self._tiempo_carga = time.time() - inicio
         
         if resultado:
@@ -89,6 +126,16 @@ cdef class PyGrafoDisperso:
         
         return resultado
     
+    def solicitar_detencion(self):
+        """
+        Solicita cancelar la carga de datos en curso.
+
+        Seguro de llamar desde otro hilo: el bucle de carga en C++ consulta
+        la señal periódicamente y cargar_datos retorna False al abortar.
+        """
+        print("[Cython] Solicitud recibida: Cancelar carga.")
+        self._grafo.solicitarDetencion()
+
     def bfs(self, int nodo_inicio, int profundidad_maxima) -> list:
         """
         Ejecuta búsqueda en anchura (BFS) desde un nodo.
@@ -102,8 +149,10 @@ cdef class PyGrafoDisperso:
         """
         print(f"[Cython] Solicitud recibida: BFS desde Nodo {nodo_inicio}, Profundidad {profundidad_maxima}.")
         
-        cdef vector[pair[int, int]] resultado = self._grafo.BFS(nodo_inicio, profundidad_maxima)
-        
+        cdef vector[pair[int, int]] resultado
+        with nogil:
+            resultado = self._grafo.BFS(nodo_inicio, profundidad_maxima)
+
         # Convertir a lista Python
         py_resultado = [(p.first, p.second) for p in resultado]
         
@@ -122,8 +171,10 @@ cdef class PyGrafoDisperso:
         """
         print(f"[Cython] Solicitud recibida: DFS desde Nodo {nodo_inicio}.")
         
-        cdef vector[int] resultado = self._grafo.DFS(nodo_inicio)
-        
+        cdef vector[int] resultado
+        with nogil:
+            resultado = self._grafo.DFS(nodo_inicio)
+
         py_resultado = list(resultado)
         print(f"[Cython] Retornando {len(py_resultado)} nodos a Python.")
         return py_resultado
@@ -182,8 +233,10 @@ cdef class PyGrafoDisperso:
         """
         print("[Cython] Solicitud recibida: Obtener nodo con mayor grado.")
         
-        cdef pair[int, int] resultado = self._grafo.getNodoMayorGrado()
-        
+        cdef pair[int, int] resultado
+        with nogil:
+            resultado = self._grafo.getNodoMayorGrado()
+
         return (resultado.first, resultado.second)
     
     def get_memoria_usada(self) -> int:
@@ -204,28 +257,112 @@ cdef class PyGrafoDisperso:
         """
         return self._grafo.getMemoriaUsada() / (1024.0 * 1024.0)
     
-    def get_aristas_subgrafo(self, int nodo_inicio, int profundidad_maxima) -> list:
+    def get_aristas_subgrafo(self, int nodo_inicio, int profundidad_maxima,
+                             int max_aristas=-1):
         """
         Obtiene las aristas del subgrafo resultante de un BFS.
-        
+
         Args:
             nodo_inicio: Nodo de inicio
             profundidad_maxima: Profundidad máxima de búsqueda
-            
+            max_aristas: Máximo de aristas a recolectar (-1 = sin límite);
+                el recorrido C++ se detiene al alcanzar el límite
+
         Returns:
-            list: Lista de tuplas (origen, destino)
+            np.ndarray: Arreglo de forma (E, 2) int64 con pares (origen, destino)
         """
         print(f"[Cython] Solicitud recibida: Subgrafo desde Nodo {nodo_inicio}.")
-        
-        cdef vector[pair[int, int]] aristas = self._grafo.getAristasSubgrafo(
-            nodo_inicio, profundidad_maxima
-        )
-        
-        py_aristas = [(a.first, a.second) for a in aristas]
-        
+
+        cdef vector[pair[int, int]] aristas
+        with nogil:
+            aristas = self._grafo.getAristasSubgrafo(nodo_inicio, profundidad_maxima,
+                                                     max_aristas)
+
         print(f"[Cython] Retornando lista de adyacencia local a Python.")
-        return py_aristas
+        return _aristas_a_ndarray(aristas)
     
+    def bfs_con_aristas(self, int nodo_inicio, int profundidad_maxima,
+                        int max_aristas=-1) -> tuple:
+        """
+        Ejecuta un BFS y obtiene las aristas del subgrafo en un solo recorrido.
+
+        Equivale a llamar bfs() y get_aristas_subgrafo() con los mismos
+        argumentos, pero recorre la estructura CSR una sola vez.
+
+        Args:
+            nodo_inicio: ID del nodo de inicio
+            profundidad_maxima: Límite de profundidad
+            max_aristas: Máximo de aristas a recolectar (-1 = sin límite);
+                el recorrido C++ se detiene al alcanzar el límite
+
+        Returns:
+            tuple: (lista de tuplas (nodo, distancia),
+                    np.ndarray de forma (E, 2) con pares (origen, destino))
+        """
+        print(f"[Cython] Solicitud recibida: BFS con aristas desde Nodo {nodo_inicio}, "
+              f"Profundidad {profundidad_maxima}.")
+
+        cdef vector[pair[int, int]] niveles
+        cdef vector[pair[int, int]] aristas
+
+        with nogil:
+            self._grafo.BFSConAristas(nodo_inicio, profundidad_maxima, niveles, aristas,
+                                      max_aristas)
+
+        py_niveles = [(p.first, p.second) for p in niveles]
+
+        print(f"[Cython] Retornando {len(py_niveles)} nodos y {aristas.size()} aristas a Python.")
+        return py_niveles, _aristas_a_ndarray(aristas)
+
+    cdef _vista_csr(self, const int* datos, cnp.npy_intp n):
+        """
+        Crea una vista NumPy de solo lectura sobre un buffer CSR de C++.
+
+        Cero copias: el arreglo apunta directamente a la memoria del vector
+        C++ y mantiene una referencia al wrapper para que el grafo no se
+        libere mientras la vista exista.
+        """
+        if n == 0:
+            return np.empty(0, dtype=np.int32)
+
+        cdef cnp.ndarray arr = cnp.PyArray_SimpleNewFromData(
+            1, &n, cnp.NPY_INT32, <void*>datos
+        )
+        Py_INCREF(self)
+        cnp.PyArray_SetBaseObject(arr, self)
+        arr.setflags(write=False)
+        return arr
+
+    def get_indptr(self):
+        """
+        Obtiene el vector row_ptr del CSR como vista NumPy (cero copias).
+
+        Junto con get_indices() permite escribir análisis propios en
+        Python/NumPy/Numba sin recompilar el núcleo C++: los vecinos del
+        nodo i son indices[indptr[i]:indptr[i+1]].
+
+        La vista queda invalidada si se carga un nuevo dataset.
+
+        Returns:
+            np.ndarray: Arreglo int32 de tamaño num_nodos + 1, solo lectura
+        """
+        if self._grafo.getNumNodos() == 0:
+            return np.empty(0, dtype=np.int32)
+        return self._vista_csr(self._grafo.getRowPtrData(),
+                               self._grafo.getNumNodos() + 1)
+
+    def get_indices(self):
+        """
+        Obtiene el vector column_indices del CSR como vista NumPy (cero copias).
+
+        La vista queda invalidada si se carga un nuevo dataset.
+
+        Returns:
+            np.ndarray: Arreglo int32 de tamaño num_aristas, solo lectura
+        """
+        return self._vista_csr(self._grafo.getColumnIndicesData(),
+                               self._grafo.getNumAristas())
+
     def print_debug_info(self):
         """Imprime información de debug del grafo."""
         self._grafo.printDebugInfo()
@@ -1,3 +1,4 @@
+# cython: language_level=3, boundscheck=False
 """
 neuronet_gui.py
 Interfaz Gráfica de Usuario para NeuroNet
@@ -11,6 +12,8 @@ Autor: NeuroNet Team
 
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, scrolledtext
+import concurrent.futures
+import queue
 import threading
 import os
 import sys
@@ -33,6 +36,7 @@ except ImportError:
 try:
     import matplotlib.pyplot as plt
     from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+    from matplotlib.collections import LineCollection
     import matplotlib
     matplotlib.use('TkAgg')
     MATPLOTLIB_DISPONIBLE = True
@@ -45,19 +49,62 @@ try:
 except ImportError:
     NETWORKX_DISPONIBLE = False
 
+# Opcional: acelera el coloreado de nodos en la visualización
+try:
+    import numpy as np
+    NUMPY_DISPONIBLE = True
+except ImportError:
+    NUMPY_DISPONIBLE = False
+
 
 class ConsoleRedirector:
-    """Redirige la salida estándar a un widget de texto."""
-    
+    """
+    Redirige la salida estándar a un widget de texto.
+
+    Las escrituras se acumulan en un buffer y se vuelcan al widget en una
+    sola operación mediante `after_idle`, de modo que una ráfaga de prints
+    (por ejemplo, durante la carga de un grafo grande) cuesta un único
+    redibujado del widget en lugar de uno por llamada a write().
+    """
+
+    # Máximo de líneas retenidas en el widget para mantener pequeño
+    # su árbol interno de texto
+    MAX_LINEAS = 2000
+
     def __init__(self, text_widget):
         self.text_widget = text_widget
-        
+        self._buf = []
+        # write() puede llamarse desde hilos de trabajo (los prints del
+        # wrapper durante una carga) mientras _flush corre en el hilo de Tk
+        self._lock = threading.Lock()
+        self._pending = False
+
     def write(self, string):
+        with self._lock:
+            self._buf.append(string)
+            if self._pending:
+                return
+            self._pending = True
+        self.text_widget.after_idle(self._flush)
+
+    def _flush(self):
+        """Vuelca el buffer acumulado al widget en una sola inserción."""
+        with self._lock:
+            buf, self._buf = self._buf, []
+            self._pending = False
+        s = "".join(buf)
+
         self.text_widget.configure(state='normal')
-        self.text_widget.insert(tk.END, string)
+        self.text_widget.insert(tk.END, s)
+
+        # Recortar el texto retenido si excede el límite de líneas
+        num_lineas = int(self.text_widget.index('end-1c').split('.')[0])
+        if num_lineas > self.MAX_LINEAS:
+            self.text_widget.delete('1.0', f'end-{self.MAX_LINEAS}l')
+
         self.text_widget.see(tk.END)
         self.text_widget.configure(state='disabled')
-        
+
     def flush(self):
         pass
 
@@ -87,6 +134,30 @@ class NeuroNetGUI:
         self.grafo = None
         if CORE_DISPONIBLE:
             self.grafo = neuronet_core.PyGrafoDisperso()
+
+        # Cache de layouts calculados, indexado por (nodo, profundidad, aristas)
+        self._layout_cache = {}
+
+        # Última visualización dibujada: (clave, G, nivel_nodo, artista de nodos).
+        # Si se repite la misma clave solo se actualizan los colores del
+        # artista existente, sin reconstruir el grafo ni la figura.
+        self._viz_actual = None
+
+        # Fondo rasterizado del eje (sin nodos) para redibujos por blit
+        self._viz_bg = None
+
+        # Ejecutor para las cargas de datasets, con Future cancelable
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=2)
+        self._carga_future = None
+        self._carga_cancelada = False
+
+        # Al cerrar la ventana: cancelar la carga en curso y liberar hilos
+        self.root.protocol("WM_DELETE_WINDOW", self._al_cerrar)
+
+        # Cola de mensajes de log: los hilos de trabajo producen, el hilo
+        # de Tk consume en lotes mediante un timer (los widgets de Tk solo
+        # deben tocarse desde el hilo principal)
+        self._log_q = queue.Queue()
         
         # Variables de estado
         self.archivo_cargado = tk.StringVar(value="Ninguno")
@@ -95,6 +166,12 @@ class NeuroNetGUI:
         self.memoria_usada = tk.StringVar(value="0 MB")
         self.tiempo_carga = tk.StringVar(value="0.00 s")
         self.nodo_mayor_grado = tk.StringVar(value="-")
+
+        # Parámetros de búsqueda: IntVars validados en el propio widget,
+        # los manejadores leen el entero directamente sin parsear strings
+        self.var_nodo_inicio = tk.IntVar(value=0)
+        self.var_profundidad = tk.IntVar(value=2)
+        self.var_nodo_dfs = tk.IntVar(value=0)
         
         # Configurar estilos
         self._configurar_estilos()
@@ -104,7 +181,10 @@ class NeuroNetGUI:
         
         # Redirigir salida de consola
         self._configurar_consola()
-        
+
+        # Iniciar el drenado periódico de la cola de log
+        self.root.after(50, self._drain_log_queue)
+
         # Log inicial
         self._log("="*50)
         self._log("NeuroNet - Sistema de Análisis de Grafos Masivos")
@@ -152,12 +232,19 @@ class NeuroNetGUI:
         ttk.Label(control_frame, text="Carga de Datos", style='Header.TLabel').pack(pady=(0, 10))
         
         ttk.Button(
-            control_frame, 
-            text="📂 Cargar Dataset", 
+            control_frame,
+            text="📂 Cargar Dataset",
             command=self._cargar_archivo,
             style='Action.TButton',
             width=25
         ).pack(pady=5)
+
+        ttk.Button(
+            control_frame,
+            text="⛔ Cancelar Carga",
+            command=self._cancelar_carga,
+            width=25
+        ).pack(pady=5)
         
         ttk.Separator(control_frame, orient='horizontal').pack(fill='x', pady=15)
         
@@ -178,16 +265,23 @@ class NeuroNetGUI:
         
         params_frame = ttk.Frame(control_frame)
         params_frame.pack(pady=5)
-        
+
+        # Solo se aceptan dígitos (o campo vacío mientras se edita)
+        vcmd = (self.root.register(lambda s: s == "" or s.isdigit()), '%P')
+
         ttk.Label(params_frame, text="Nodo inicio:").grid(row=0, column=0, padx=5, pady=2)
-        self.entry_nodo_inicio = ttk.Entry(params_frame, width=10)
-        self.entry_nodo_inicio.grid(row=0, column=1, padx=5, pady=2)
-        self.entry_nodo_inicio.insert(0, "0")
-        
+        ttk.Spinbox(
+            params_frame, width=10, from_=0, to=10**9,
+            textvariable=self.var_nodo_inicio,
+            validate='key', validatecommand=vcmd
+        ).grid(row=0, column=1, padx=5, pady=2)
+
         ttk.Label(params_frame, text="Profundidad:").grid(row=1, column=0, padx=5, pady=2)
-        self.entry_profundidad = ttk.Entry(params_frame, width=10)
-        self.entry_profundidad.grid(row=1, column=1, padx=5, pady=2)
-        self.entry_profundidad.insert(0, "2")
+        ttk.Spinbox(
+            params_frame, width=10, from_=0, to=100,
+            textvariable=self.var_profundidad,
+            validate='key', validatecommand=vcmd
+        ).grid(row=1, column=1, padx=5, pady=2)
         
         ttk.Button(
             control_frame,
@@ -212,9 +306,11 @@ class NeuroNetGUI:
         dfs_frame.pack(pady=5)
         
         ttk.Label(dfs_frame, text="Nodo inicio:").grid(row=0, column=0, padx=5, pady=2)
-        self.entry_nodo_dfs = ttk.Entry(dfs_frame, width=10)
-        self.entry_nodo_dfs.grid(row=0, column=1, padx=5, pady=2)
-        self.entry_nodo_dfs.insert(0, "0")
+        ttk.Spinbox(
+            dfs_frame, width=10, from_=0, to=10**9,
+            textvariable=self.var_nodo_dfs,
+            validate='key', validatecommand=vcmd
+        ).grid(row=0, column=1, padx=5, pady=2)
         
         ttk.Button(
             control_frame,
@@ -260,6 +356,11 @@ class NeuroNetGUI:
             self.ax.set_title("Ejecute un BFS para visualizar el subgrafo")
             self.ax.axis('off')
             self.canvas.draw()
+
+            # Un cambio de tamaño invalida el fondo guardado para blit
+            self.canvas.mpl_connect(
+                'resize_event', lambda event: setattr(self, '_viz_bg', None)
+            )
         else:
             ttk.Label(
                 self.viz_frame, 
@@ -287,12 +388,30 @@ class NeuroNetGUI:
         sys.stdout = ConsoleRedirector(self.console)
     
     def _log(self, mensaje):
-        """Escribe un mensaje en la consola."""
-        self.console.configure(state='normal')
-        self.console.insert(tk.END, mensaje + "\n")
-        self.console.see(tk.END)
-        self.console.configure(state='disabled')
-        self.root.update_idletasks()
+        """
+        Encola un mensaje para la consola.
+
+        Seguro de llamar desde cualquier hilo: el mensaje se inserta en el
+        widget desde el hilo de Tk en el siguiente drenado de la cola.
+        """
+        self._log_q.put(mensaje + "\n")
+
+    def _drain_log_queue(self):
+        """Vuelca los mensajes pendientes a la consola en una sola inserción."""
+        items = []
+        while True:
+            try:
+                items.append(self._log_q.get_nowait())
+            except queue.Empty:
+                break
+
+        if items:
+            self.console.configure(state='normal')
+            self.console.insert(tk.END, "".join(items))
+            self.console.see(tk.END)
+            self.console.configure(state='disabled')
+
+        self.root.after(50, self._drain_log_queue)
     
     def _cargar_archivo(self):
         """Abre un diálogo para seleccionar y cargar un dataset."""
@@ -309,33 +428,101 @@ class NeuroNetGUI:
         )
         
         if archivo:
+            if self._carga_future is not None and not self._carga_future.done():
+                messagebox.showwarning("Advertencia", "Ya hay una carga en curso.")
+                return
+
             self._log(f"\n{'='*50}")
             self._log(f"Cargando archivo: {archivo}")
             self._log(f"{'='*50}")
-            
-            # Ejecutar en hilo separado para no bloquear la GUI
-            def cargar():
-                try:
-                    exito = self.grafo.cargar_datos(archivo)
-                    
-                    if exito:
-                        # Actualizar estadísticas
-                        self.archivo_cargado.set(os.path.basename(archivo))
-                        self.num_nodos.set(f"{self.grafo.get_num_nodos():,}")
-                        self.num_aristas.set(f"{self.grafo.get_num_aristas():,}")
-                        self.memoria_usada.set(f"{self.grafo.get_memoria_usada_mb():.2f} MB")
-                        self.tiempo_carga.set(f"{self.grafo.tiempo_carga:.3f} s")
-                        
-                        self._log("\n[GUI] Archivo cargado exitosamente.")
-                    else:
-                        messagebox.showerror("Error", "No se pudo cargar el archivo.")
-                        
-                except Exception as e:
-                    self._log(f"[ERROR] {str(e)}")
-                    messagebox.showerror("Error", f"Error al cargar: {str(e)}")
-            
-            threading.Thread(target=cargar, daemon=True).start()
+
+            # Ejecutar en el pool de hilos para no bloquear la GUI; el
+            # resultado se procesa en el hilo de Tk vía after()
+            self._carga_cancelada = False
+            self._carga_future = self._executor.submit(self.grafo.cargar_datos, archivo)
+            self._carga_future.add_done_callback(
+                lambda f: self.root.after(0, self._al_terminar_carga, f, archivo)
+            )
+
+    def _cancelar_carga(self):
+        """Cancela la carga de dataset en curso, si la hay."""
+        future = self._carga_future
+        if future is None or future.done():
+            self._log("[GUI] No hay ninguna carga en curso.")
+            return
+
+        # Si aún está en cola basta con cancelar el Future; si ya se está
+        # ejecutando, señalar al bucle de carga de C++ para que aborte
+        self._carga_cancelada = True
+        if not future.cancel():
+            self.grafo.solicitar_detencion()
+        self._log("[GUI] Cancelación de carga solicitada.")
+
+    def _al_terminar_carga(self, future, archivo):
+        """
+        Procesa el resultado de una carga de dataset.
+
+        Se ejecuta en el hilo de Tk, por lo que puede tocar widgets y
+        variables directamente.
+
+        Args:
+            future: Future de la carga terminada
+            archivo: Ruta del archivo que se cargó
+        """
+        if future.cancelled():
+            self._log("[GUI] Carga cancelada.")
+            return
+
+        try:
+            exito = future.result()
+        except Exception as e:
+            self._log(f"[ERROR] {str(e)}")
+            messagebox.showerror("Error", f"Error al cargar: {str(e)}")
+            return
+
+        if exito:
+            # El cache de layouts y la visualización pertenecen
+            # al dataset anterior
+            self._layout_cache.clear()
+            self._viz_actual = None
+
+            self._aplicar_stats({
+                'archivo_cargado': os.path.basename(archivo),
+                'num_nodos': f"{self.grafo.get_num_nodos():,}",
+                'num_aristas': f"{self.grafo.get_num_aristas():,}",
+                'memoria_usada': f"{self.grafo.get_memoria_usada_mb():.2f} MB",
+                'tiempo_carga': f"{self.grafo.tiempo_carga:.3f} s",
+            })
+
+            self._log("\n[GUI] Archivo cargado exitosamente.")
+        elif self._carga_cancelada:
+            # El retorno False viene de la cancelación pedida por el
+            # usuario, no de un fallo de carga
+            self._log("[GUI] Carga cancelada.")
+        else:
+            messagebox.showerror("Error", "No se pudo cargar el archivo.")
+
+    def _al_cerrar(self):
+        """Cierra la aplicación cancelando cualquier carga en curso."""
+        if self.grafo is not None:
+            self.grafo.solicitar_detencion()
+        self._executor.shutdown(wait=False)
+        self.root.destroy()
     
+    def _aplicar_stats(self, stats):
+        """
+        Aplica un lote de estadísticas a las variables de Tk.
+
+        Se ejecuta en el hilo de Tk vía after(); agrupar los set() en un
+        solo callback provoca un único re-layout del panel de estadísticas.
+
+        Args:
+            stats: Diccionario {nombre_de_variable: valor_formateado}
+        """
+        for nombre, valor in stats.items():
+            getattr(self, nombre).set(valor)
+        self.root.update_idletasks()
+
     def _identificar_nodo_critico(self):
         """Identifica el nodo con mayor grado en el grafo."""
         if not self._verificar_grafo_cargado():
@@ -361,12 +548,12 @@ class NeuroNetGUI:
             return
         
         try:
-            nodo_inicio = int(self.entry_nodo_inicio.get())
-            profundidad = int(self.entry_profundidad.get())
-        except ValueError:
+            nodo_inicio = self.var_nodo_inicio.get()
+            profundidad = self.var_profundidad.get()
+        except tk.TclError:
             messagebox.showerror("Error", "Ingrese valores numéricos válidos.")
             return
-        
+
         self._log("\n" + "="*50)
         self._log(f"Ejecutando BFS desde nodo {nodo_inicio} con profundidad {profundidad}")
         self._log("="*50)
@@ -394,8 +581,8 @@ class NeuroNetGUI:
             return
         
         try:
-            nodo_inicio = int(self.entry_nodo_dfs.get())
-        except ValueError:
+            nodo_inicio = self.var_nodo_dfs.get()
+        except tk.TclError:
             messagebox.showerror("Error", "Ingrese un valor numérico válido.")
             return
         
@@ -431,29 +618,49 @@ class NeuroNetGUI:
             return
         
         try:
-            nodo_inicio = int(self.entry_nodo_inicio.get())
-            profundidad = int(self.entry_profundidad.get())
-        except ValueError:
+            nodo_inicio = self.var_nodo_inicio.get()
+            profundidad = self.var_profundidad.get()
+        except tk.TclError:
             messagebox.showerror("Error", "Ingrese valores numéricos válidos.")
             return
-        
+
         self._log("\n" + "="*50)
         self._log(f"Generando visualización del subgrafo...")
         self._log("="*50)
-        
+
+        # Redibujo del mismo subgrafo: solo actualizar colores del artista,
+        # por blit si hay fondo guardado (restaurar + dibujar solo los nodos)
+        clave = (nodo_inicio, profundidad)
+        if self._viz_actual is not None and self._viz_actual[0] == clave:
+            _, G, nivel_nodo, node_artist, etiquetas = self._viz_actual
+            node_artist.set_facecolor(self._calcular_colores(G, nodo_inicio, nivel_nodo))
+            if self._viz_bg is not None:
+                self.canvas.restore_region(self._viz_bg)
+                self.ax.draw_artist(node_artist)
+                # Las etiquetas van encima de los nodos (zorder=3)
+                for etiqueta in etiquetas:
+                    self.ax.draw_artist(etiqueta)
+                self.canvas.blit(self.ax.bbox)
+            else:
+                self.canvas.draw_idle()
+            self._log("[GUI] Visualización actualizada desde cache.")
+            return
+
         try:
-            # Obtener aristas del subgrafo
-            aristas = self.grafo.get_aristas_subgrafo(nodo_inicio, profundidad)
-            
-            if not aristas:
+            # Obtener niveles y aristas del subgrafo en un solo recorrido BFS.
+            # El límite de aristas se aplica en C++: el recorrido se detiene
+            # al alcanzarlo en lugar de recolectar todo y descartar aquí.
+            max_aristas = 500
+            bfs_result, aristas = self.grafo.bfs_con_aristas(
+                nodo_inicio, profundidad, max_aristas
+            )
+
+            if len(aristas) == 0:
                 self._log("[ADVERTENCIA] No se encontraron aristas para visualizar.")
                 return
-            
-            # Limitar número de aristas para visualización
-            max_aristas = 500
-            if len(aristas) > max_aristas:
-                self._log(f"[INFO] Limitando visualización a {max_aristas} aristas de {len(aristas)}")
-                aristas = aristas[:max_aristas]
+
+            if len(aristas) == max_aristas:
+                self._log(f"[INFO] Visualización limitada a {max_aristas} aristas.")
             
             # Crear grafo de NetworkX (SOLO para dibujar, no para calcular)
             G = nx.DiGraph()
@@ -462,32 +669,21 @@ class NeuroNetGUI:
             # Limpiar el canvas
             self.ax.clear()
             
-            # Configurar colores por nivel
-            bfs_result = self.grafo.bfs(nodo_inicio, profundidad)
+            # Configurar colores por nivel (niveles ya calculados por el BFS)
             nivel_nodo = {nodo: nivel for nodo, nivel in bfs_result if nodo in G.nodes()}
             
-            # Colores por nivel
-            colores = []
-            for nodo in G.nodes():
-                if nodo == nodo_inicio:
-                    colores.append('#ff0000')  # Rojo para el nodo inicial
-                elif nodo in nivel_nodo:
-                    nivel = nivel_nodo[nodo]
-                    if nivel == 1:
-                        colores.append('#ff9900')  # Naranja para nivel 1
-                    else:
-                        colores.append('#3399ff')  # Azul para otros niveles
-                else:
-                    colores.append('#cccccc')  # Gris para nodos sin nivel
+            # Colores por nivel: rojo para el nodo inicial, naranja para
+            # nivel 1, azul para niveles superiores y gris para nodos sin nivel
+            colores = self._calcular_colores(G, nodo_inicio, nivel_nodo)
             
-            # Dibujar el grafo
-            pos = nx.spring_layout(G, k=2, iterations=50)
+            # Dibujar el grafo (layout memoizado: re-visualizar es instantáneo)
+            pos = self._calcular_layout(G, nodo_inicio, profundidad, len(aristas))
             
-            nx.draw_networkx_nodes(G, pos, ax=self.ax, node_color=colores, 
-                                   node_size=300, alpha=0.9)
-            nx.draw_networkx_edges(G, pos, ax=self.ax, edge_color='#666666',
-                                   arrows=True, arrowsize=10, alpha=0.5)
-            nx.draw_networkx_labels(G, pos, ax=self.ax, font_size=8)
+            # Dibujo directo con colecciones de matplotlib: una LineCollection
+            # para todas las aristas y un scatter para todos los nodos, en
+            # lugar de un artista por elemento como hace nx.draw_networkx_*
+            node_artist, etiquetas = self._dibujar_subgrafo(G, pos, colores)
+            self._viz_actual = (clave, G, nivel_nodo, node_artist, etiquetas)
             
             self.ax.set_title(f"Subgrafo desde nodo {nodo_inicio} (profundidad {profundidad})\n"
                               f"Nodos: {G.number_of_nodes()} | Aristas: {G.number_of_edges()}")
@@ -504,8 +700,21 @@ class NeuroNetGUI:
                        markersize=10, label='Nivel 2+'),
             ]
             self.ax.legend(handles=legend_elements, loc='upper left')
-            
+
+            # Dibujo completo, guardando el fondo sin nodos ni etiquetas para
+            # que los siguientes cambios de color se resuelvan por blit; al
+            # componer se respeta el orden nodos -> etiquetas (zorder 2 -> 3)
+            node_artist.set_visible(False)
+            for etiqueta in etiquetas:
+                etiqueta.set_visible(False)
             self.canvas.draw()
+            self._viz_bg = self.canvas.copy_from_bbox(self.ax.bbox)
+            node_artist.set_visible(True)
+            self.ax.draw_artist(node_artist)
+            for etiqueta in etiquetas:
+                etiqueta.set_visible(True)
+                self.ax.draw_artist(etiqueta)
+            self.canvas.blit(self.ax.bbox)
             
             self._log(f"[GUI] Visualización generada: {G.number_of_nodes()} nodos, "
                       f"{G.number_of_edges()} aristas")
@@ -515,6 +724,120 @@ class NeuroNetGUI:
             import traceback
             traceback.print_exc()
     
+    def _dibujar_subgrafo(self, G, pos, colores):
+        """
+        Dibuja el subgrafo en el eje con dos llamadas de dibujo.
+
+        Todas las aristas se agrupan en una sola LineCollection y todos los
+        nodos en un solo scatter, de modo que matplotlib procesa dos
+        colecciones en lugar de cientos de artistas individuales. Las
+        etiquetas se omiten en subgrafos grandes, donde serían ilegibles.
+
+        Args:
+            G: Grafo de NetworkX a dibujar
+            pos: Posiciones {nodo: (x, y)}
+            colores: Lista de colores por nodo, en el orden de G.nodes()
+
+        Returns:
+            tuple: (artista de los nodos, lista de artistas de etiquetas),
+                para actualizaciones de color y recomposición por blit
+        """
+        nodos = list(G.nodes())
+
+        if G.number_of_edges() > 0:
+            segmentos = np.array([(pos[u], pos[v]) for u, v in G.edges()])
+            self.ax.add_collection(LineCollection(
+                segmentos, colors='#666666', alpha=0.5, linewidths=0.8
+            ))
+
+        xy = np.array([pos[n] for n in nodos])
+        node_artist = self.ax.scatter(xy[:, 0], xy[:, 1], c=colores, s=300,
+                                      alpha=0.9, zorder=2)
+
+        etiquetas = []
+        if len(nodos) <= 100:
+            for nodo, (x, y) in zip(nodos, xy):
+                etiquetas.append(self.ax.annotate(
+                    str(nodo), (x, y), fontsize=8,
+                    ha='center', va='center', zorder=3
+                ))
+
+        return node_artist, etiquetas
+
+    def _calcular_layout(self, G, nodo_inicio, profundidad, num_aristas):
+        """
+        Calcula (o recupera del cache) las posiciones de los nodos.
+
+        Intenta usar el layout sfdp de Graphviz (implementación en C) y,
+        si pygraphviz no está disponible, recurre a spring_layout con
+        semilla fija. El resultado se memoiza para que re-visualizar el
+        mismo subgrafo no repita el cálculo.
+
+        Args:
+            G: Grafo de NetworkX a dibujar
+            nodo_inicio: Nodo de inicio del BFS
+            profundidad: Profundidad del BFS
+            num_aristas: Número de aristas del subgrafo
+
+        Returns:
+            dict: Posiciones {nodo: (x, y)}
+        """
+        clave = (nodo_inicio, profundidad, num_aristas)
+        if clave in self._layout_cache:
+            self._log("[GUI] Layout recuperado del cache.")
+            return self._layout_cache[clave]
+
+        try:
+            pos = nx.nx_agraph.graphviz_layout(G, prog='sfdp')
+        except ImportError:
+            pos = nx.spring_layout(G, k=2, iterations=50, seed=42)
+
+        self._layout_cache[clave] = pos
+        return pos
+
+    def _calcular_colores(self, G, nodo_inicio, nivel_nodo):
+        """
+        Calcula el color de cada nodo del subgrafo según su nivel BFS.
+
+        Con NumPy disponible el cálculo es una única búsqueda vectorizada
+        (un solo bucle en C) en lugar de un bucle Python por nodo.
+
+        Args:
+            G: Grafo de NetworkX a dibujar
+            nodo_inicio: Nodo de inicio del BFS
+            nivel_nodo: Diccionario {nodo: nivel}
+
+        Returns:
+            list: Lista de códigos de color hex, en el orden de G.nodes()
+        """
+        if NUMPY_DISPONIBLE:
+            nodes = np.fromiter(G.nodes(), dtype=np.int64)
+            levels = np.full(nodes.shape, -1, dtype=np.int64)
+
+            if nivel_nodo:
+                items = np.array(list(nivel_nodo.items()), dtype=np.int64)
+                orden = np.argsort(nodes)
+                idx = orden[np.searchsorted(nodes, items[:, 0], sorter=orden)]
+                levels[idx] = items[:, 1]
+
+            colores = np.select(
+                [nodes == nodo_inicio, levels == 1, levels >= 2],
+                ['#ff0000', '#ff9900', '#3399ff'],
+                default='#cccccc'
+            )
+            return colores.tolist()
+
+        # Sin NumPy: bucle Python equivalente
+        colores = []
+        for nodo in G.nodes():
+            if nodo == nodo_inicio:
+                colores.append('#ff0000')
+            elif nodo in nivel_nodo:
+                colores.append('#ff9900' if nivel_nodo[nodo] == 1 else '#3399ff')
+            else:
+                colores.append('#cccccc')
+        return colores
+
     def _verificar_grafo_cargado(self) -> bool:
         """Verifica si hay un grafo cargado."""
         if not CORE_DISPONIBLE:
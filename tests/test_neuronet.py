@@ -49,6 +49,14 @@ class TestGrafoDisperso:
         assert grafo.get_num_nodos() > 0
         assert grafo.get_num_aristas() > 0
     
+    def test_solicitar_detencion_no_afecta_cargas_nuevas(self):
+        """Prueba que la señal de cancelación se reinicia en cada carga"""
+        g = neuronet_core.PyGrafoDisperso()
+        g.solicitar_detencion()
+
+        if os.path.exists(EJEMPLO_GRAFO):
+            assert g.cargar_datos(EJEMPLO_GRAFO) == True
+
     def test_cargar_archivo_inexistente(self):
         """Prueba el manejo de archivo inexistente"""
         g = neuronet_core.PyGrafoDisperso()
@@ -116,13 +124,46 @@ class TestGrafoDisperso:
     def test_aristas_subgrafo(self, grafo):
         """Prueba la obtención de aristas del subgrafo"""
         aristas = grafo.get_aristas_subgrafo(0, 2)
-        assert len(aristas) >= 0
-        
-        # Verificar que las aristas son tuplas válidas
+
+        # Las aristas se retornan como arreglo NumPy (E, 2) int64
+        assert aristas.ndim == 2
+        assert aristas.shape[1] == 2
+
+        # Verificar que las aristas son pares válidos
         for origen, destino in aristas:
             assert origen >= 0
             assert destino >= 0
-    
+
+    def test_aristas_subgrafo_con_limite(self, grafo):
+        """Prueba el límite de aristas aplicado en el recorrido C++"""
+        aristas = grafo.get_aristas_subgrafo(0, 2)
+
+        if len(aristas) > 1:
+            limitadas = grafo.get_aristas_subgrafo(0, 2, 1)
+            assert len(limitadas) == 1
+            assert (limitadas[0] == aristas[0]).all()
+    
+    def test_bfs_con_aristas(self, grafo):
+        """Prueba el BFS combinado con obtención de aristas"""
+        niveles, aristas = grafo.bfs_con_aristas(0, 2)
+
+        # Debe coincidir con las llamadas separadas
+        assert niveles == grafo.bfs(0, 2)
+        assert (aristas == grafo.get_aristas_subgrafo(0, 2)).all()
+
+    def test_vistas_csr(self, grafo):
+        """Prueba las vistas NumPy zero-copy de la estructura CSR"""
+        indptr = grafo.get_indptr()
+        indices = grafo.get_indices()
+
+        assert len(indptr) == grafo.get_num_nodos() + 1
+        assert len(indices) == grafo.get_num_aristas()
+        assert indptr[-1] == grafo.get_num_aristas()
+
+        # Los vecinos leídos de las vistas coinciden con get_vecinos
+        vecinos = list(indices[indptr[0]:indptr[1]])
+        assert vecinos == grafo.get_vecinos(0)
+
     def test_estadisticas(self, grafo):
         """Prueba la obtención de estadísticas"""
         stats = grafo.get_estadisticas()